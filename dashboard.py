@@ -5,19 +5,19 @@ A comprehensive dashboard showcasing various chart types and interactive feature
 using the Bokeh visualization library.
 """
 
-from bokeh.plotting import figure, curdoc
-from bokeh.layouts import column, row, gridplot
+from bokeh.plotting import figure
+from bokeh.layouts import column, row
 from bokeh.models import (
     ColumnDataSource, HoverTool, Legend, LegendItem,
-    Div, Select, DateRangeSlider, Panel, Tabs,
-    NumeralTickFormatter, DatetimeTickFormatter,
-    BoxAnnotation, Span, Label
+    Div, NumeralTickFormatter, DatetimeTickFormatter,
+    Span, Label, FactorRange
 )
-from bokeh.palettes import Category10, Spectral6, Viridis256
-from bokeh.transform import factor_cmap, cumsum
-from bokeh.io import show, output_file
+from bokeh.transform import factor_cmap
+from bokeh.embed import file_html
+from bokeh.resources import CDN
+from bokeh.util.browser import view
+import itertools
 import numpy as np
-import pandas as pd
 
 from data_generator import (
     generate_sales_data,
@@ -60,34 +60,34 @@ def style_figure(fig):
     fig.border_fill_color = THEME['background']
     fig.outline_line_color = THEME['grid_color']
     
-    fig.xgrid.grid_line_color = THEME['grid_color']
-    fig.ygrid.grid_line_color = THEME['grid_color']
-    fig.xgrid.grid_line_alpha = 0.3
-    fig.ygrid.grid_line_alpha = 0.3
+    for grid in [*fig.xgrid, *fig.ygrid]:
+        grid.update(grid_line_color=THEME['grid_color'], grid_line_alpha=0.3)
     
-    fig.xaxis.axis_line_color = THEME['grid_color']
-    fig.yaxis.axis_line_color = THEME['grid_color']
-    fig.xaxis.major_tick_line_color = THEME['grid_color']
-    fig.yaxis.major_tick_line_color = THEME['grid_color']
-    fig.xaxis.minor_tick_line_color = None
-    fig.yaxis.minor_tick_line_color = None
-    
-    fig.xaxis.major_label_text_color = THEME['text_color']
-    fig.yaxis.major_label_text_color = THEME['text_color']
-    fig.xaxis.axis_label_text_color = THEME['text_color']
-    fig.yaxis.axis_label_text_color = THEME['text_color']
+    axis_style = dict(
+        axis_line_color=THEME['grid_color'],
+        major_tick_line_color=THEME['grid_color'],
+        minor_tick_line_color=None,
+        major_label_text_color=THEME['text_color'],
+        axis_label_text_color=THEME['text_color']
+    )
+    for axis in [*fig.xaxis, *fig.yaxis]:
+        axis.update(**axis_style)
     
     if fig.title:
-        fig.title.text_color = THEME['text_color']
-        fig.title.text_font_size = '14pt'
-        fig.title.text_font = 'Helvetica'
+        fig.title.update(
+            text_color=THEME['text_color'],
+            text_font_size='14pt',
+            text_font='Helvetica'
+        )
     
     if fig.legend:
         for legend in fig.legend:
-            legend.background_fill_color = THEME['plot_bg']
-            legend.background_fill_alpha = 0.8
-            legend.border_line_color = THEME['grid_color']
-            legend.label_text_color = THEME['text_color']
+            legend.update(
+                background_fill_color=THEME['plot_bg'],
+                background_fill_alpha=0.8,
+                border_line_color=THEME['grid_color'],
+                label_text_color=THEME['text_color']
+            )
     
     return fig
 
@@ -105,14 +105,15 @@ def create_line_chart():
         x_axis_type='datetime',
         width=600,
         height=400,
-        tools="pan,box_zoom,wheel_zoom,reset,save"
+        tools="pan,box_zoom,wheel_zoom,reset"
     )
     
-    products = df['product'].unique()
+    # A single sort and groupby pass gives each product its own source,
+    # shared by that product's line and markers
+    df_sorted = df.sort_values('date').astype({'sales': np.float32})
     legend_items = []
     
-    for i, product in enumerate(products):
-        product_data = df[df['product'] == product].sort_values('date')
+    for i, (product, product_data) in enumerate(df_sorted.groupby('product', observed=True)):
         source = ColumnDataSource(product_data)
         
         line = fig.line(
@@ -149,10 +150,10 @@ def create_line_chart():
     legend = Legend(items=legend_items, location="top_left", click_policy="hide")
     fig.add_layout(legend, 'right')
     
-    fig.xaxis.formatter = DatetimeTickFormatter(months='%b %Y')
-    fig.yaxis.formatter = NumeralTickFormatter(format='$0,0')
-    fig.xaxis.axis_label = "Month"
-    fig.yaxis.axis_label = "Sales Revenue"
+    for axis in fig.xaxis:
+        axis.update(formatter=DatetimeTickFormatter(months='%b %Y'), axis_label="Month")
+    for axis in fig.yaxis:
+        axis.update(formatter=NumeralTickFormatter(format='$0,0'), axis_label="Sales Revenue")
     
     return style_figure(fig)
 
@@ -163,13 +164,14 @@ def create_bar_chart():
     df = df.sort_values('revenue', ascending=True)
     
     source = ColumnDataSource(df)
+    regions = df['region'].tolist()
     
     fig = figure(
         title="🌍 Revenue by Region",
-        y_range=df['region'].tolist(),
+        y_range=regions,
         width=600,
         height=400,
-        tools="pan,box_zoom,wheel_zoom,reset,save"
+        tools="pan,box_zoom,wheel_zoom,reset"
     )
     
     # Create gradient-like effect with bars
@@ -178,21 +180,26 @@ def create_bar_chart():
         right='revenue',
         source=source,
         height=0.6,
-        color=factor_cmap('region', palette=PALETTE, factors=df['region'].tolist()),
+        color=factor_cmap('region', palette=PALETTE, factors=regions),
         alpha=0.85,
         line_color=THEME['text_color'],
         line_width=1
     )
     
     # Add value labels
-    for i, (region, revenue) in enumerate(zip(df['region'], df['revenue'])):
-        fig.text(
-            x=[revenue + 5000], y=[region],
-            text=[f'${revenue:,.0f}'],
-            text_color=THEME['text_color'],
-            text_font_size='11px',
-            text_baseline='middle'
-        )
+    label_source = ColumnDataSource({
+        'x': df['revenue'] + 5000,
+        'y': regions,
+        'label': [f'${revenue:,.0f}' for revenue in df['revenue']]
+    })
+    fig.text(
+        x='x', y='y',
+        text='label',
+        source=label_source,
+        text_color=THEME['text_color'],
+        text_font_size='11px',
+        text_baseline='middle'
+    )
     
     hover = HoverTool(
         tooltips=[
@@ -204,8 +211,8 @@ def create_bar_chart():
     )
     fig.add_tools(hover)
     
-    fig.xaxis.formatter = NumeralTickFormatter(format='$0,0')
-    fig.xaxis.axis_label = "Revenue ($)"
+    for axis in fig.xaxis:
+        axis.update(formatter=NumeralTickFormatter(format='$0,0'), axis_label="Revenue ($)")
     
     return style_figure(fig)
 
@@ -246,8 +253,8 @@ def create_scatter_plot():
     )
     fig.add_tools(hover)
     
-    fig.legend.location = "top_left"
-    fig.legend.click_policy = "hide"
+    for legend in fig.legend:
+        legend.update(location="top_left", click_policy="hide")
     fig.xaxis.axis_label = "Feature X"
     fig.yaxis.axis_label = "Feature Y"
     
@@ -259,7 +266,7 @@ def create_area_chart():
     df = generate_sales_data(12)
     
     # Pivot data for stacking
-    pivot_df = df.pivot_table(index='date', columns='product', values='sales', aggfunc='sum')
+    pivot_df = df.pivot(index='date', columns='product', values='sales')
     pivot_df = pivot_df.reset_index()
     
     fig = figure(
@@ -267,42 +274,27 @@ def create_area_chart():
         x_axis_type='datetime',
         width=600,
         height=400,
-        tools="pan,box_zoom,wheel_zoom,reset,save"
+        tools="pan,box_zoom,wheel_zoom,reset"
     )
     
     products = [col for col in pivot_df.columns if col != 'date']
     
-    # Stack the areas
-    bottom = np.zeros(len(pivot_df))
-    
-    for i, product in enumerate(products):
-        top = bottom + pivot_df[product].values
-        
-        source = ColumnDataSource({
-            'date': pivot_df['date'],
-            'bottom': bottom,
-            'top': top,
-            'product': [product] * len(pivot_df)
-        })
-        
-        fig.varea(
-            x='date',
-            y1='bottom',
-            y2='top',
-            source=source,
-            fill_color=PALETTE[i % len(PALETTE)],
-            fill_alpha=0.7,
-            legend_label=product
-        )
-        
-        bottom = top
+    # Stack the areas client-side from a single wide-format source
+    fig.varea_stack(
+        stackers=products,
+        x='date',
+        source=ColumnDataSource(pivot_df),
+        fill_color=[PALETTE[i % len(PALETTE)] for i in range(len(products))],
+        fill_alpha=0.7,
+        legend_label=products
+    )
     
-    fig.legend.location = "top_left"
-    fig.legend.click_policy = "hide"
-    fig.xaxis.formatter = DatetimeTickFormatter(months='%b %Y')
-    fig.yaxis.formatter = NumeralTickFormatter(format='$0,0')
-    fig.xaxis.axis_label = "Month"
-    fig.yaxis.axis_label = "Cumulative Sales"
+    for legend in fig.legend:
+        legend.update(location="top_left", click_policy="hide")
+    for axis in fig.xaxis:
+        axis.update(formatter=DatetimeTickFormatter(months='%b %Y'), axis_label="Month")
+    for axis in fig.yaxis:
+        axis.update(formatter=NumeralTickFormatter(format='$0,0'), axis_label="Cumulative Sales")
     
     return style_figure(fig)
 
@@ -311,8 +303,8 @@ def create_donut_chart():
     """Create donut/pie chart for device distribution"""
     df = generate_pie_data()
     
-    # Calculate mid angles for label positioning
-    df['mid_angle'] = (df['start_angle'] + df['end_angle']) / 2
+    # Calculate mid angles for label positioning (assign keeps the cached frame intact)
+    df = df.assign(mid_angle=(df['start_angle'] + df['end_angle']) / 2)
     
     source = ColumnDataSource(df)
     
@@ -341,20 +333,21 @@ def create_donut_chart():
     )
     
     # Add labels
-    for _, row in df.iterrows():
-        angle = row['mid_angle']
-        x = 0.65 * np.cos(angle)
-        y = 0.65 * np.sin(angle)
-        
-        fig.text(
-            x=[x], y=[y],
-            text=[f"{row['percentage']:.0f}%"],
-            text_color='white',
-            text_font_size='12px',
-            text_align='center',
-            text_baseline='middle',
-            text_font_style='bold'
-        )
+    label_source = ColumnDataSource({
+        'x': 0.65 * np.cos(df['mid_angle']),
+        'y': 0.65 * np.sin(df['mid_angle']),
+        'label': [f"{percentage:.0f}%" for percentage in df['percentage']]
+    })
+    fig.text(
+        x='x', y='y',
+        text='label',
+        source=label_source,
+        text_color='white',
+        text_font_size='12px',
+        text_align='center',
+        text_baseline='middle',
+        text_font_style='bold'
+    )
     
     # Add center text
     fig.text(
@@ -370,20 +363,26 @@ def create_donut_chart():
     fig.grid.visible = False
     
     # Add legend manually
-    for i, (_, row) in enumerate(df.iterrows()):
-        fig.rect(
-            x=[1.15], y=[0.7 - i * 0.25],
-            width=0.1, height=0.12,
-            color=row['color'],
-            alpha=0.9
-        )
-        fig.text(
-            x=[1.25], y=[0.7 - i * 0.25],
-            text=[row['category']],
-            text_color=THEME['text_color'],
-            text_font_size='10px',
-            text_baseline='middle'
-        )
+    legend_source = ColumnDataSource({
+        'y': 0.7 - np.arange(len(df)) * 0.25,
+        'color': df['color'],
+        'category': df['category']
+    })
+    fig.rect(
+        x=1.15, y='y',
+        width=0.1, height=0.12,
+        color='color',
+        source=legend_source,
+        alpha=0.9
+    )
+    fig.text(
+        x=1.25, y='y',
+        text='category',
+        source=legend_source,
+        text_color=THEME['text_color'],
+        text_font_size='10px',
+        text_baseline='middle'
+    )
     
     return style_figure(fig)
 
@@ -391,7 +390,10 @@ def create_donut_chart():
 def create_time_series_chart():
     """Create time series chart with moving average"""
     df = generate_time_series_data(90)
-    source = ColumnDataSource(df)
+    
+    # float32 price columns halve the binary payload embedded in the page
+    price_columns = ['price', 'high', 'low', 'moving_avg']
+    source = ColumnDataSource(df.astype(dict.fromkeys(price_columns, np.float32)))
     
     fig = figure(
         title="📉 Stock Price Analysis with Moving Average",
@@ -447,11 +449,11 @@ def create_time_series_chart():
     )
     fig.add_tools(hover)
     
-    fig.legend.location = "top_left"
-    fig.legend.click_policy = "hide"
+    for legend in fig.legend:
+        legend.update(location="top_left", click_policy="hide")
     fig.xaxis.axis_label = "Date"
-    fig.yaxis.axis_label = "Price ($)"
-    fig.yaxis.formatter = NumeralTickFormatter(format='$0.00')
+    for axis in fig.yaxis:
+        axis.update(formatter=NumeralTickFormatter(format='$0.00'), axis_label="Price ($)")
     
     return style_figure(fig)
 
@@ -461,28 +463,25 @@ def create_grouped_bar_chart():
     df = generate_performance_data()
     
     metrics = ['productivity', 'quality', 'efficiency']
-    x = [(team, metric) for team in df['team'] for metric in metrics]
+    x = list(itertools.product(df['team'], metrics))
     
     # Create colors list matching the data
-    colors = [PALETTE[0], PALETTE[1], PALETTE[2]] * len(df)
+    colors = PALETTE[:3] * len(df)
     
     data = {
         'x': x,
-        'value': sum([[row['productivity'], row['quality'], row['efficiency']] 
-                      for _, row in df.iterrows()], []),
+        'value': df[metrics].to_numpy().ravel().tolist(),
         'color': colors
     }
     
     source = ColumnDataSource(data)
     
-    from bokeh.models import FactorRange
-    
     fig = figure(
         title="🏆 Team Performance Metrics",
         x_range=FactorRange(*x),
         width=900,
         height=400,
-        tools="pan,box_zoom,wheel_zoom,reset,save"
+        tools="pan,box_zoom,wheel_zoom,reset"
     )
     
     fig.vbar(
@@ -516,11 +515,9 @@ def create_grouped_bar_chart():
     
     fig.xaxis.major_label_orientation = 0.8
     fig.yaxis.axis_label = "Score (%)"
-    fig.y_range.start = 0
-    fig.y_range.end = 110
+    fig.y_range.update(start=0, end=110)
     
     # Add custom legend
-    from bokeh.models import Legend, LegendItem
     legend_items = [
         LegendItem(label='Productivity', renderers=[]),
         LegendItem(label='Quality', renderers=[]),
@@ -570,15 +567,25 @@ def create_dashboard_header():
     return Div(text=header_html, width=1200)
 
 
+def create_section_divider(title):
+    """Create a section heading Div"""
+    return Div(text=f"""
+        <h2 style="color: #e0e0e0; font-family: 'Segoe UI', Arial, sans-serif; 
+                   border-bottom: 2px solid #2a2a3a; padding-bottom: 10px; margin: 30px 0 20px 0;">
+            {title}
+        </h2>
+    """, width=1200)
+
+
 def create_kpi_cards():
     """Create KPI summary cards"""
-    sales_df = generate_sales_data()
+    sales_df = generate_sales_data(12)
     regional_df = generate_regional_data()
     
-    total_sales = sales_df['sales'].sum()
-    total_customers = regional_df['customers'].sum()
-    avg_satisfaction = regional_df['satisfaction'].mean()
-    avg_growth = regional_df['growth'].mean()
+    total_sales = sales_df['sales'].to_numpy().sum()
+    total_customers = regional_df['customers'].to_numpy().sum()
+    avg_satisfaction = regional_df['satisfaction'].to_numpy().mean()
+    avg_growth = regional_df['growth'].to_numpy().mean()
     
     kpi_html = f"""
     <div style="display: flex; gap: 20px; margin-bottom: 25px;">
@@ -651,26 +658,9 @@ def create_dashboard():
     grouped_bar = create_grouped_bar_chart()
     
     # Section dividers
-    section1 = Div(text="""
-        <h2 style="color: #e0e0e0; font-family: 'Segoe UI', Arial, sans-serif; 
-                   border-bottom: 2px solid #2a2a3a; padding-bottom: 10px; margin: 30px 0 20px 0;">
-            📊 Sales & Revenue Analytics
-        </h2>
-    """, width=1200)
-    
-    section2 = Div(text="""
-        <h2 style="color: #e0e0e0; font-family: 'Segoe UI', Arial, sans-serif; 
-                   border-bottom: 2px solid #2a2a3a; padding-bottom: 10px; margin: 30px 0 20px 0;">
-            📈 Advanced Analytics & Insights
-        </h2>
-    """, width=1200)
-    
-    section3 = Div(text="""
-        <h2 style="color: #e0e0e0; font-family: 'Segoe UI', Arial, sans-serif; 
-                   border-bottom: 2px solid #2a2a3a; padding-bottom: 10px; margin: 30px 0 20px 0;">
-            🎯 Performance Overview
-        </h2>
-    """, width=1200)
+    section1 = create_section_divider("📊 Sales & Revenue Analytics")
+    section2 = create_section_divider("📈 Advanced Analytics & Insights")
+    section3 = create_section_divider("🎯 Performance Overview")
     
     # Footer
     footer = Div(text="""
@@ -708,12 +698,6 @@ def create_dashboard():
 # MAIN EXECUTION
 # ============================================================================
 
-# For running as a standalone HTML file
-output_file(
-    "dashboard.html",
-    title="Data Visualization Dashboard - Bokeh"
-)
-
 # Create and display the dashboard
 dashboard = create_dashboard()
 
@@ -733,8 +717,12 @@ page_css = Div(text="""
 
 final_layout = column(page_css, dashboard)
 
+# Save as a standalone HTML file that loads BokehJS from the (cacheable) CDN
+with open("dashboard.html", "w", encoding="utf-8") as f:
+    f.write(file_html(final_layout, CDN, "Data Visualization Dashboard - Bokeh"))
+
 # Show in browser
-show(final_layout)
+view("dashboard.html")
 
 print("""
 ╔══════════════════════════════════════════════════════════════════╗
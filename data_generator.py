@@ -1,16 +1,23 @@
 """
 Sample Data Generator Module
 Generates realistic sample data for the visualization dashboard
+
+Generators are memoized, so callers share the returned DataFrames and
+must treat them as read-only (use .copy() or .assign() before mutating).
+Label columns (product, region, team, category) are pandas Categoricals.
 """
 
+from functools import lru_cache
+
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 
 
+@lru_cache(maxsize=4)
 def generate_sales_data(months: int = 12) -> pd.DataFrame:
     """Generate monthly sales data for multiple products"""
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     
     products = ['Electronics', 'Clothing', 'Food & Beverages', 'Home & Garden', 'Sports']
     dates = pd.date_range(
@@ -19,64 +26,68 @@ def generate_sales_data(months: int = 12) -> pd.DataFrame:
         freq='ME'
     )
     
-    data = []
-    for product in products:
-        base_sales = np.random.randint(10000, 50000)
-        trend = np.linspace(0, np.random.randint(-5000, 10000), months)
-        seasonality = 5000 * np.sin(np.linspace(0, 2 * np.pi, months))
-        noise = np.random.normal(0, 2000, months)
-        
-        sales = base_sales + trend + seasonality + noise
-        sales = np.maximum(sales, 1000)  # Ensure positive sales
-        
-        for i, date in enumerate(dates):
-            data.append({
-                'date': date,
-                'product': product,
-                'sales': int(sales[i]),
-                'units': int(sales[i] / np.random.randint(20, 100))
-            })
-    
-    return pd.DataFrame(data)
+    n_products = len(products)
+    
+    # Build (products x months) matrices in one shot
+    base_sales = rng.integers(10000, 50000, size=(n_products, 1))
+    trend = np.linspace(0, rng.integers(-5000, 10000, size=n_products), months, axis=1)
+    seasonality = 5000 * np.sin(np.linspace(0, 2 * np.pi, months))[None, :]
+    noise = rng.normal(0, 2000, (n_products, months))
+    
+    sales = base_sales + trend + seasonality + noise
+    sales = np.maximum(sales, 1000)  # Ensure positive sales
+    units = sales / rng.integers(20, 100, size=sales.shape)
+    
+    return pd.DataFrame({
+        'date': np.tile(dates, n_products),
+        'product': pd.Categorical(np.repeat(products, months), categories=products),
+        'sales': sales.ravel().astype(np.int64),
+        'units': units.ravel().astype(np.int64)
+    })
 
 
+@lru_cache(maxsize=4)
 def generate_regional_data() -> pd.DataFrame:
     """Generate sales data by region"""
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     
     regions = ['North America', 'Europe', 'Asia Pacific', 'Latin America', 'Middle East']
     
-    data = {
-        'region': regions,
-        'revenue': np.random.randint(100000, 500000, len(regions)),
-        'growth': np.random.uniform(-5, 25, len(regions)),
-        'customers': np.random.randint(1000, 10000, len(regions)),
-        'satisfaction': np.random.uniform(3.5, 5.0, len(regions))
-    }
+    # One uniform draw per column, scaled into each metric's range
+    vals = rng.random((len(regions), 4))
     
-    return pd.DataFrame(data)
+    return pd.DataFrame({
+        'region': pd.Categorical(regions, categories=regions),
+        'revenue': (vals[:, 0] * 400000 + 100000).astype(np.int64),
+        'growth': vals[:, 1] * 30 - 5,
+        'customers': (vals[:, 2] * 9000 + 1000).astype(np.int64),
+        'satisfaction': vals[:, 3] * 1.5 + 3.5
+    })
 
 
+@lru_cache(maxsize=4)
 def generate_performance_data() -> pd.DataFrame:
     """Generate employee/team performance metrics"""
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     
     teams = ['Engineering', 'Sales', 'Marketing', 'Operations', 'Support', 'HR']
     
-    data = {
-        'team': teams,
-        'productivity': np.random.uniform(70, 100, len(teams)),
-        'quality': np.random.uniform(80, 99, len(teams)),
-        'efficiency': np.random.uniform(65, 95, len(teams)),
-        'headcount': np.random.randint(10, 100, len(teams))
-    }
+    # One uniform draw per column, scaled into each metric's range
+    vals = rng.random((len(teams), 4))
     
-    return pd.DataFrame(data)
+    return pd.DataFrame({
+        'team': pd.Categorical(teams, categories=teams),
+        'productivity': vals[:, 0] * 30 + 70,
+        'quality': vals[:, 1] * 19 + 80,
+        'efficiency': vals[:, 2] * 30 + 65,
+        'headcount': (vals[:, 3] * 90 + 10).astype(np.int64)
+    })
 
 
+@lru_cache(maxsize=4)
 def generate_time_series_data(days: int = 90) -> pd.DataFrame:
     """Generate time series data for stock-like visualization"""
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     
     dates = pd.date_range(
         start=datetime.now() - timedelta(days=days),
@@ -84,58 +95,54 @@ def generate_time_series_data(days: int = 90) -> pd.DataFrame:
         freq='D'
     )
     
-    # Generate random walk for stock-like data
-    price = 100
-    prices = [price]
+    # Generate random walk for stock-like data, floored at 10 after every step.
+    # Adding the running maximum of the shortfall below the floor reproduces the
+    # step-wise clamp exactly without a Python loop.
+    walk = 100 + np.concatenate([[0], np.cumsum(rng.normal(0, 2, days - 1))])
+    prices = walk + np.maximum.accumulate(np.maximum(10 - walk, 0))
     
-    for _ in range(days - 1):
-        change = np.random.normal(0, 2)
-        price = max(price + change, 10)
-        prices.append(price)
+    # 7-day moving average from a cumulative sum (NaN until a full window exists)
+    window_sums = np.cumsum(np.insert(prices, 0, 0))
+    moving_avg = np.full(days, np.nan)
+    moving_avg[6:] = (window_sums[7:] - window_sums[:-7]) / 7
     
-    prices = np.array(prices)
-    volumes = np.random.randint(100000, 1000000, days)
+    volumes = rng.integers(100000, 1000000, days)
     
     return pd.DataFrame({
         'date': dates,
         'price': prices,
         'volume': volumes,
-        'high': prices + np.random.uniform(0, 5, days),
-        'low': prices - np.random.uniform(0, 5, days),
-        'moving_avg': pd.Series(prices).rolling(window=7).mean()
+        'high': prices + rng.uniform(0, 5, days),
+        'low': prices - rng.uniform(0, 5, days),
+        'moving_avg': moving_avg
     })
 
 
+@lru_cache(maxsize=4)
 def generate_scatter_data(n_points: int = 100) -> pd.DataFrame:
     """Generate scatter plot data with clusters"""
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     
     categories = ['Category A', 'Category B', 'Category C']
-    data = []
-    
     centers = [(30, 40), (60, 70), (80, 30)]
+    per_cluster = n_points // 3
     
-    for i, (category, center) in enumerate(zip(categories, centers)):
-        x = np.random.normal(center[0], 10, n_points // 3)
-        y = np.random.normal(center[1], 10, n_points // 3)
-        size = np.random.uniform(5, 20, n_points // 3)
-        
-        for j in range(len(x)):
-            data.append({
-                'x': x[j],
-                'y': y[j],
-                'size': size[j],
-                'category': category,
-                'value': x[j] * y[j] / 100
-            })
+    x = np.concatenate([rng.normal(cx, 10, per_cluster) for cx, _ in centers])
+    y = np.concatenate([rng.normal(cy, 10, per_cluster) for _, cy in centers])
+    size = rng.uniform(5, 20, per_cluster * len(centers))
     
-    return pd.DataFrame(data)
+    return pd.DataFrame({
+        'x': x,
+        'y': y,
+        'size': size,
+        'category': pd.Categorical(np.repeat(categories, per_cluster), categories=categories),
+        'value': x * y / 100
+    })
 
 
+@lru_cache(maxsize=4)
 def generate_pie_data() -> pd.DataFrame:
     """Generate data for pie/donut charts"""
-    np.random.seed(42)
-    
     categories = ['Desktop', 'Mobile', 'Tablet', 'Smart TV', 'Other']
     values = np.array([45, 35, 12, 5, 3])
     